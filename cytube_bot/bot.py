@@ -1,9 +1,12 @@
 import re
+import sys
 import json
 import logging
 import asyncio
 import collections
 
+import requests
+
 from .error import (
     CytubeError,
     SocketConfigError, LoginError,
@@ -24,8 +27,11 @@ class Bot:
     ----------
     get : `function` (url, loop)
         HTTP GET coroutine.
-    socket_io : `function` (url, loop)
+        The default uses an HTTP session owned by the bot,
+        shared with the default `socket_io` and closed when `run` exits.
+    socket_io : `None` or `function` (url, loop)
         socket.io connect coroutine.
+        `None` - `SocketIO.connect` using the bot's HTTP session.
     response_timeout : `float`
         socket.io event response timeout in seconds.
     restart_delay : `None` or `float`
@@ -43,8 +49,8 @@ class Bot:
         socket.io server URL.
     socket : `None` or `cytube_bot.socket_io.SocketIO`
         socket.io connection.
-    handlers : `collections.defaultdict` of (`str`, `list` of `function`)
-        Event handlers.
+    handlers : `dict` of (`str`, `list` of (`bool`, `function`))
+        Event handlers and their `asyncio.iscoroutinefunction` results.
     """
     logger = logging.getLogger(__name__)
 
@@ -52,7 +58,6 @@ class Bot:
     SOCKET_IO_URL = '%(domain)s/socket.io/'
 
     GUEST_LOGIN_LIMIT = re.compile(r'guest logins .* ([0-9]+) seconds\.', re.I)
-    MUTED = re.compile(r'.*\bmuted', re.I)
 
     EVENT_LOG_LEVEL = {
         'mediaUpdate': logging.DEBUG,
@@ -62,13 +67,15 @@ class Bot:
 
     EVENT_LOG_LEVEL_DEFAULT = logging.INFO
 
+    EVENT_COALESCE = {}
+
     def __init__(self, domain,
                  channel, user=None,
                  restart_delay=5,
                  loop=None,
                  response_timeout=0.1,
                  get=default_get,
-                 socket_io=SocketIO.connect):
+                 socket_io=None):
         """
         Parameters
         ----------
@@ -87,8 +94,9 @@ class Bot:
             socket.io event response timeout in seconds.
         get : `function` (url, loop), optional
             HTTP GET coroutine.
-        socket_io : `function` (url, loop), optional
+        socket_io : `None` or `function` (url, loop), optional
             socket.io connect coroutine.
+            `None` - `SocketIO.connect` using the bot's HTTP session.
         """
         self.get = get
         self.socket_io = socket_io
@@ -96,14 +104,42 @@ class Bot:
         self.restart_delay = restart_delay
         self.domain = domain
         self.channel = Channel(*to_sequence(channel))
+        self._playlist = self.channel.playlist
         self.user = User(*to_sequence(user))
         self.loop = loop or asyncio.get_event_loop()
         self.server = None
         self.socket = None
-        self.handlers = collections.defaultdict(list)
-        for attr in dir(self):
-            if attr.startswith('_on_'):
-                self.on(attr[4:], getattr(self, attr))
+        self._http_session = None
+        self.handlers = {}
+        self._next_trigger = {}
+        self._coalesced = collections.OrderedDict()
+        self._builtin = {}
+        for event, attr in self._get_builtin_handlers().items():
+            handler = getattr(self, attr)
+            self._builtin[event] = (
+                asyncio.iscoroutinefunction(handler), handler
+            )
+
+    @classmethod
+    def _get_builtin_handlers(cls):
+        """Get built-in event handler names.
+
+        The mapping is built once per class and cached in `_EVENT_HANDLERS`.
+
+        Returns
+        -------
+        `dict` of (`str`, `str`)
+            Event name to method name.
+        """
+        handlers = cls.__dict__.get('_EVENT_HANDLERS')
+        if handlers is None:
+            handlers = {
+                sys.intern(attr[4:]): attr
+                for attr in dir(cls)
+                if attr.startswith('_on_')
+            }
+            cls._EVENT_HANDLERS = handlers
+        return handlers
 
     def _on_rank(self, _, data):
         self.user.rank = data
@@ -136,7 +172,7 @@ class Bot:
             raise LoginError('invalid channel password')
 
     def _on_noflood(self, _, data):
-        self.loger.error('noflood: %r', data)
+        self.logger.error('noflood: %r', data)
 
     def _on_errorMsg(self, _, data):
         self.logger.error('error: %r', data)
@@ -148,30 +184,43 @@ class Bot:
     def _on_kick(_, data):
         raise Kicked(data)
 
-    def _add_user(self, data):
+    def _get_user(self, data, users=None):
         if data['name'] == self.user.name:
-            self.user.update(**data)
-            self.channel.userlist.add(self.user)
+            user = self.user
+        elif users is not None:
+            user = users.get(data['name'])
         else:
-            self.channel.userlist.add(User(**data))
+            user = None
+        if user is None:
+            return User(**data)
+        user.update(**data)
+        return user
+
+    def _add_user(self, data):
+        self.channel.userlist.add(self._get_user(data))
 
     def _on_userlist(self, _, data):
-        self.channel.userlist.clear()
-        for user in data:
-            self._add_user(user)
-        self.logger.info('userlist: %s', self.channel.userlist)
+        users = dict(self.channel.userlist)
+        self.channel.userlist.replace(
+            self._get_user(user, users) for user in data
+        )
+        self.logger.info('userlist: %d users', len(self.channel.userlist))
 
     def _on_addUser(self, _, data):
         self._add_user(data)
-        self.logger.info('userlist: %s', self.channel.userlist)
+        self.logger.info(
+            'addUser: %s (%d users)',
+            data['name'], len(self.channel.userlist)
+        )
 
     def _on_userLeave(self, _, data):
         user = data['name']
-        try:
-            del self.channel.userlist[user]
-        except KeyError:
+        if self.channel.userlist.pop(user, None) is None:
             self.logger.error('userLeave: %s not found', user)
-        self.logger.info('userlist: %s', self.channel.userlist)
+        self.logger.info(
+            'userLeave: %s (%d users)',
+            user, len(self.channel.userlist)
+        )
 
     def _on_setUserMeta(self, _, data):
         self.channel.userlist[data['name']].meta = data['meta']
@@ -187,11 +236,11 @@ class Bot:
         self.logger.info('leader %r', self.channel.userlist.leader)
 
     def _on_setPlaylistMeta(self, _, data):
-        self.channel.playlist.time = data.get('rawTime', 0)
+        self._playlist.time = data.get('rawTime', 0)
 
     def _on_mediaUpdate(self, _, data):
-        self.channel.playlist.paused = data.get('paused', True)
-        self.channel.playlist.current_time = data.get('currentTime', 0)
+        self._playlist.paused = data.get('paused', True)
+        self._playlist.current_time = data.get('currentTime', 0)
 
     def _on_voteskip(self, _, data):
         self.channel.voteskip_count = data.get('count', 0)
@@ -203,36 +252,43 @@ class Bot:
         )
 
     def _on_setCurrent(self, _, data):
-        self.channel.playlist.current = data
-        self.logger.info('setCurrent %s', self.channel.playlist.current)
+        self._playlist.current = data
+        self.logger.info('setCurrent %s', self._playlist.current)
 
     def _on_queue(self, _, data):
-        self.channel.playlist.add(data['after'], data['item'])
-        self.logger.info('queue %s', self.channel.playlist.queue)
+        self._playlist.add(data['after'], data['item'])
+        self.logger.info('queue %r after %s', data['item'], data['after'])
 
     def _on_delete(self, _, data):
-        self.channel.playlist.remove(data['uid'])
-        self.logger.info('delete %s', self.channel.playlist.queue)
+        self._playlist.remove(data['uid'])
+        self.logger.info('delete %s', data['uid'])
 
     def _on_setTemp(self, _, data):
-        self.channel.playlist.get(data['uid']).temp = data['temp']
+        self._playlist.get(data['uid']).temp = data['temp']
 
     def _on_moveVideo(self, _, data):
-        self.channel.playlist.move(data['from'], data['after'])
-        self.logger.info('move %s', self.channel.playlist.queue)
+        self._playlist.move(data['from'], data['after'])
+        self.logger.info('move %s after %s', data['from'], data['after'])
 
     def _on_playlist(self, _, data):
-        self.channel.playlist.clear()
+        playlist = self._playlist
+        playlist.clear()
         for item in data:
-            self.channel.playlist.add(None, item)
-        self.logger.info('playlist %s', self.channel.playlist.queue)
+            playlist.add(None, item)
+        self.logger.info('playlist: %d items', len(playlist.queue))
 
     def _on_setPlaylistLocked(self, _, data):
-        self.channel.playlist.locked = data
+        self._playlist.locked = data
         self.logger.info('playlist locked %s', data)
 
-    @asyncio.coroutine
-    def get_socket_config(self):
+    def _http_get(self, url, loop):
+        if self.get is not default_get:
+            return self.get(url, loop=loop)
+        if self._http_session is None:
+            self._http_session = requests.Session()
+        return default_get(url, loop=loop, session=self._http_session)
+
+    async def get_socket_config(self):
         """Get server URL.
 
         Raises
@@ -248,7 +304,7 @@ class Bot:
             url = 'https://' + url
         self.logger.info('get_socket_config %s', url)
         try:
-            conf = yield from self.get(url, loop=self.loop)
+            conf = await self._http_get(url, loop=self.loop)
         except (CytubeError, asyncio.CancelledError):
             raise
         except Exception as ex:
@@ -257,34 +313,35 @@ class Bot:
         self.logger.info(conf)
         if 'error' in conf:
             raise SocketConfigError(conf['error'])
-        try:
-            server = next(
-                srv['url']
-                for srv in conf['servers']
-                if srv['secure']
-            )
-            self.logger.info('secure server %s', server)
-        except (KeyError, StopIteration):
-            self.logger.info('no secure servers')
-            try:
-                server = next(srv['url'] for srv in conf['servers'])
-                self.logger.info('server %s', server)
-            except (KeyError, StopIteration):
+        server = None
+        for srv in conf.get('servers', ()):
+            srv_url = srv.get('url')
+            if srv_url is None:
+                continue
+            if srv.get('secure'):
+                server = srv_url
+                self.logger.info('secure server %s', server)
+                break
+            if server is None:
+                server = srv_url
+        else:
+            if server is None:
                 self.logger.info('no servers')
                 raise SocketConfigError('no servers in socket config', conf)
+            self.logger.info('no secure servers, server %s', server)
         data['domain'] = server
         self.server = self.SOCKET_IO_URL % data
 
-    @asyncio.coroutine
-    def disconnect(self):
+    async def disconnect(self):
         """Disconnect.
         """
         self.logger.info('disconnect %s', self.server)
+        self._coalesced.clear()
         if self.socket is None:
             self.logger.info('already disconnected')
             return
         try:
-            yield from self.socket.close()
+            await self.socket.close()
         except Exception as ex:
             self.logger.error('socket.close(): %s: %r', self.server, ex)
             raise
@@ -292,22 +349,25 @@ class Bot:
             self.socket = None
             self.user.rank = -1
 
-    @asyncio.coroutine
-    def connect(self):
+    async def connect(self):
         """Get server URL and connect.
 
         Raises
         ------
         `cytube_bot.error.SocketIOError`
         """
-        yield from self.disconnect()
+        await self.disconnect()
         if self.server is None:
-            yield from self.get_socket_config()
+            await self.get_socket_config()
         self.logger.info('connect %s', self.server)
-        self.socket = yield from self.socket_io(self.server, loop=self.loop)
+        if self.socket_io is None:
+            self.socket = await SocketIO.connect(
+                self.server, loop=self.loop, get=self._http_get
+            )
+        else:
+            self.socket = await self.socket_io(self.server, loop=self.loop)
 
-    @asyncio.coroutine
-    def login(self):
+    async def login(self):
         """Connect, join channel, log in.
 
         Raises
@@ -315,10 +375,10 @@ class Bot:
         `cytube_bot.error.LoginError`
         `cytube_bot.error.SocketIOError`
         """
-        yield from self.connect()
+        await self.connect()
 
         self.logger.info('join channel %s', self.channel)
-        res = yield from self.socket.emit(
+        res = await self.socket.emit(
             'joinChannel',
             {
                 'name': self.channel.name,
@@ -335,9 +395,10 @@ class Bot:
         if not self.user.name:
             self.logger.warning('no user')
         else:
+            guest_login_match = self.GUEST_LOGIN_LIMIT.match
             while True:
                 self.logger.info('login %s', self.user)
-                res = yield from self.socket.emit(
+                res = await self.socket.emit(
                     'login',
                     {
                         'name': self.user.name,
@@ -354,41 +415,52 @@ class Bot:
                     break
                 err = res.get('error', '<no error message>')
                 self.logger.error('login error: %s', res)
-                match = self.GUEST_LOGIN_LIMIT.match(err)
-                if match:
-                    try:
-                        delay = max(int(match.group(1)), 1)
-                        self.logger.warning('sleep(%d)', delay)
-                        yield from asyncio.sleep(delay)
-                    except ValueError:
-                        raise LoginError(err)
-                else:
+                match = guest_login_match(err)
+                if match is None:
                     raise LoginError(err)
-        yield from self.trigger('login', self)
+                delay = max(int(match.group(1)), 1)
+                self.logger.warning('sleep(%d)', delay)
+                await asyncio.sleep(delay)
+        await self.trigger('login', self)
 
-    @asyncio.coroutine
-    def run(self):
+    async def run(self):
         """Main loop.
         """
+        trigger = self.trigger
+        log_error = self.logger.error
+        socket = None
+        recv = None
         try:
             while True:
                 try:
                     if self.socket is None:
                         self.logger.info('login')
-                        yield from self.login()
-                    ev, data = yield from self.socket.recv()
-                    yield from self.trigger(ev, data)
+                        await self.login()
+                    if self.socket is not socket:
+                        socket = self.socket
+                        recv = socket.recv
+                    try:
+                        ev, data = await asyncio.wait_for(
+                            recv(), self._coalesce_timeout()
+                        )
+                    except asyncio.TimeoutError:
+                        await self._flush_coalesced(due=True)
+                        continue
+                    await trigger(ev, data)
                 except SocketIOError as ex:
-                    self.logger.error('network error: %r', ex)
-                    yield from self.disconnect()
+                    log_error('network error: %r', ex)
+                    await self.disconnect()
                     if self.restart_delay is None or self.restart_delay < 0:
                         break
-                    self.logger.error('restarting')
-                    yield from asyncio.sleep(self.restart_delay)
+                    log_error('restarting')
+                    await asyncio.sleep(self.restart_delay)
         except asyncio.CancelledError:
             self.logger.info('cancelled')
         finally:
-            yield from self.disconnect()
+            if self._http_session is not None:
+                self._http_session.close()
+                self._http_session = None
+            await self.disconnect()
 
     def on(self, event, *handlers):
         """Add event handlers.
@@ -400,10 +472,13 @@ class Bot:
         handlers : `list` of `function`
             Event handlers.
         """
-        ev_handlers = self.handlers[event]
+        event = sys.intern(event)
+        ev_handlers = self.handlers.setdefault(event, [])
         for handler in handlers:
-            if handler not in ev_handlers:
-                ev_handlers.append(handler)
+            if all(handler != handler_ for _, handler_ in ev_handlers):
+                ev_handlers.append(
+                    (asyncio.iscoroutinefunction(handler), handler)
+                )
                 self.logger.info('on: %s %s', event, handler)
             else:
                 self.logger.warning('on: handler exists: %s %s', event, handler)
@@ -419,22 +494,56 @@ class Bot:
         handlers : `list` of `function`
             Event handlers.
         """
-        ev_handlers = self.handlers[event]
+        ev_handlers = self.handlers.get(event, [])
         for handler in handlers:
-            try:
-                ev_handlers.remove(handler)
-                self.logger.info('off: %s %s', event, handler)
-            except ValueError:
+            for i, (_, handler_) in enumerate(ev_handlers):
+                if handler == handler_:
+                    del ev_handlers[i]
+                    self.logger.info('off: %s %s', event, handler)
+                    break
+            else:
                 self.logger.warning(
                     'off: handler not found: %s %s',
                     event, handler
                 )
         return self
 
-    @asyncio.coroutine
-    def trigger(self, event, data):
+    def _coalesce_timeout(self):
+        """Get seconds until the next coalesced event is due, or `None`."""
+        if not self._coalesced:
+            return None
+        deadline = min(map(self._next_trigger.get, self._coalesced))
+        return max(deadline - self.loop.time(), 0)
+
+    async def _flush_coalesced(self, exclude=None, due=False):
+        """Trigger user handlers for coalesced events.
+
+        Parameters
+        ----------
+        exclude : `None` or `str`, optional
+            Event to keep pending.
+        due : `bool`, optional
+            `True` to flush only events whose interval has expired.
+        """
+        now = self.loop.time()
+        for event in list(self._coalesced):
+            if event == exclude:
+                continue
+            if due and now < self._next_trigger[event]:
+                continue
+            data = self._coalesced.pop(event)
+            self._next_trigger[event] = now + self.EVENT_COALESCE.get(event, 0)
+            self.logger.debug('flush coalesced: %s', event)
+            await self._dispatch(event, data, None, self.handlers.get(event))
+
+    async def trigger(self, event, data):
         """Trigger an event.
 
+        User handlers of events in `EVENT_COALESCE` are triggered at most
+        once per interval, with the latest data; built-in handlers are not
+        delayed. Pending data is delivered by `run` when the interval
+        expires, or before the next event of another type.
+
         Parameters
         ----------
         event : `str`
@@ -447,12 +556,34 @@ class Bot:
         `cytube_bot.error.LoginError`
         `cytube_bot.error.Kicked`
         """
+        if self._coalesced:
+            await self._flush_coalesced(exclude=event)
+        builtin = self._builtin.get(event)
+        handlers = self.handlers.get(event)
+        if builtin is None and not handlers:
+            self.logger.debug('trigger: no handlers: %s', event)
+            return
         level = self.EVENT_LOG_LEVEL.get(event, self.EVENT_LOG_LEVEL_DEFAULT)
         self.logger.log(level, 'trigger: %s %s', event, data)
+        if handlers:
+            interval = self.EVENT_COALESCE.get(event)
+            if interval is not None:
+                now = self.loop.time()
+                if (event in self._coalesced
+                        or now < self._next_trigger.get(event, now)):
+                    self._coalesced[event] = data
+                    handlers = None
+                else:
+                    self._next_trigger[event] = now + interval
+        await self._dispatch(event, data, builtin, handlers)
+
+    async def _dispatch(self, event, data, builtin, handlers):
         try:
-            for handler in self.handlers[event]:
-                if asyncio.iscoroutinefunction(handler):
-                    stop = yield from handler(event, data)
+            if builtin is not None:
+                handlers = (builtin, *handlers) if handlers else (builtin,)
+            for is_coro, handler in handlers or ():
+                if is_coro:
+                    stop = await handler(event, data)
                 else:
                     stop = handler(event, data)
                 if stop:
@@ -462,14 +593,13 @@ class Bot:
         except Exception as ex:
             self.logger.error('trigger %s %s: %r', event, data, ex)
             if event != 'error':
-                yield from self.trigger('error', {
+                await self.trigger('error', {
                     'event': event,
                     'data': data,
                     'error': ex
                 })
 
-    @asyncio.coroutine
-    def chat(self, msg, meta=None):
+    async def chat(self, msg, meta=None):
         """Send a chat message.
 
         Parameters
@@ -501,7 +631,7 @@ class Bot:
         if self.user.muted or self.user.smuted:
             raise ChannelPermissionError('muted')
 
-        res = yield from self.socket.emit(
+        res = await self.socket.emit(
             'chatMsg',
             {'msg': msg, 'meta': meta if meta else {}},
             match_chat_response,
@@ -513,12 +643,9 @@ class Bot:
         if res[0] == 'noflood':
             self.logger.error('chat: noflood: %s', res)
             raise ChannelPermissionError(res[1].get('msg', 'noflood'))
-            #if self.MUTED.match(res['msg']):
-            #    raise ChannelPermissionError('muted')
         return res[1]
 
-    @asyncio.coroutine
-    def pm(self, to, msg, meta=None):
+    async def pm(self, to, msg, meta=None):
         """Send a private chat message.
 
         Parameters
@@ -552,7 +679,7 @@ class Bot:
         if self.user.muted or self.user.smuted:
             raise ChannelPermissionError('muted')
 
-        res = yield from self.socket.emit(
+        res = await self.socket.emit(
             'pm',
             {'msg': msg, 'to': to, 'meta': meta if meta else {}},
             match_pm_response,
@@ -566,8 +693,7 @@ class Bot:
             raise ChannelError(res[1].get('msg', '<no message>'))
         return res[1]
 
-    @asyncio.coroutine
-    def set_afk(self, value=True):
+    async def set_afk(self, value=True):
         """Set bot AFK.
 
         Parameters
@@ -579,10 +705,9 @@ class Bot:
         cytube_bot.error.ChannelPermissionError
         """
         if self.user.afk != value:
-            yield from self.socket.emit('chatMsg', {'msg': '/afk'})
+            await self.socket.emit('chatMsg', {'msg': '/afk'})
 
-    @asyncio.coroutine
-    def clear_chat(self):
+    async def clear_chat(self):
         """Clear chat.
 
         Raises
@@ -590,10 +715,9 @@ class Bot:
         cytube_bot.error.ChannelPermissionError
         """
         self.channel.check_permission('chatclear', self.user)
-        yield from self.socket.emit('chatMsg', {'msg': '/clear'})
+        await self.socket.emit('chatMsg', {'msg': '/clear'})
 
-    @asyncio.coroutine
-    def kick(self, user, reason=''):
+    async def kick(self, user, reason=''):
         """Kick a user.
 
         Parameters
@@ -621,7 +745,7 @@ class Bot:
             raise ChannelPermissionError(
                 'You do not have permission to kick ' + user.name
             )
-        res = yield from self.socket.emit(
+        res = await self.socket.emit(
             'chatMsg',
             {
                 'msg': '/kick %s %s' % (user.name, reason),
@@ -635,8 +759,7 @@ class Bot:
         if res[0] == 'errorMsg':
             raise ChannelPermissionError(res[1].get('msg', '<no message>'))
 
-    @asyncio.coroutine
-    def add_media(self, link, append=True, temp=True):
+    async def add_media(self, link, append=True, temp=True):
         """Add media link to playlist.
 
         Parameters
@@ -684,7 +807,7 @@ class Bot:
         if not isinstance(link, MediaLink):
             link = MediaLink.from_url(link)
 
-        res = yield from self.socket.emit(
+        res = await self.socket.emit(
             'queue',
             {
                 'type': link.type,
@@ -703,8 +826,7 @@ class Bot:
             raise ChannelError(res[1].get('msg', '<no message>'))
         return res[1]
 
-    @asyncio.coroutine
-    def remove_media(self, item):
+    async def remove_media(self, item):
         """Remove playlist item.
 
         Parameters
@@ -730,7 +852,7 @@ class Bot:
         self.channel.check_permission(action, self.user)
         if not isinstance(item, PlaylistItem):
             item = self.channel.playlist.get(item)
-        res = yield from self.socket.emit(
+        res = await self.socket.emit(
             'delete',
             item.uid,
             match_remove_media_response,
@@ -739,8 +861,7 @@ class Bot:
         if res is None:
             raise ChannelError('remove media response timeout')
 
-    @asyncio.coroutine
-    def move_media(self, item, after):
+    async def move_media(self, item, after):
         """Move a playlist item.
 
         Parameters
@@ -773,7 +894,7 @@ class Bot:
         if not isinstance(after, PlaylistItem):
             after = self.channel.playlist.get(after)
 
-        res = yield from self.socket.emit(
+        res = await self.socket.emit(
             'moveMedia',
             {
                 'from': item.uid,
@@ -785,8 +906,7 @@ class Bot:
         if res is None:
             raise ChannelError('move media response timeout')
 
-    @asyncio.coroutine
-    def set_current_media(self, item):
+    async def set_current_media(self, item):
         """Set current playlist item.
 
         Parameters
@@ -811,7 +931,7 @@ class Bot:
         self.channel.check_permission(action, self.user)
         if not isinstance(item, PlaylistItem):
             item = self.channel.playlist.get(item)
-        res = yield from self.socket.emit(
+        res = await self.socket.emit(
             'jumpTo',
             item.uid,
             match_set_current_response,
@@ -820,8 +940,7 @@ class Bot:
         if res is None:
             raise ChannelError('set current response timeout')
 
-    @asyncio.coroutine
-    def set_leader(self, user):
+    async def set_leader(self, user):
         """Set leader.
 
         Parameters
@@ -845,7 +964,7 @@ class Bot:
         self.channel.check_permission('leaderctl', self.user)
         if user is not None and not isinstance(user, User):
             user = self.channel.userlist.get(user)
-        res = yield from self.socket.emit(
+        res = await self.socket.emit(
             'assignLeader',
             {'name': user.name if user is not None else ''},
             match_set_leader_response,
@@ -854,13 +973,11 @@ class Bot:
         if res is None:
             raise ChannelError('set leader response timeout')
 
-    @asyncio.coroutine
-    def remove_leader(self):
+    async def remove_leader(self):
         """Remove leader."""
-        yield from self.set_leader(None)
+        await self.set_leader(None)
 
-    @asyncio.coroutine
-    def pause(self):
+    async def pause(self):
         """Pause current media.
 
         Raises
@@ -873,7 +990,7 @@ class Bot:
         if self.channel.playlist.current is None:
             return
 
-        yield from self.socket.emit('mediaUpdate', {
+        await self.socket.emit('mediaUpdate', {
             'currentTime': self.channel.playlist.current_time,
             'paused': True,
             'id': self.channel.playlist.current.link.id,
@@ -62,6 +62,7 @@ class Playlist:
         self.paused = True
         self.current_time = 0
         self._current = None
+        self._items = {}
         self.queue = []
 
     def __str__(self):
@@ -103,7 +104,7 @@ class Playlist:
 
         Parameters
         ----------
-        item : `int`
+        uid : `int` or `cytube_bot.playlist.PlaylistItem`
             Playlist item ID.
 
         Returns
@@ -115,7 +116,12 @@ class Playlist:
         ValueError
             If item does not exist.
         """
-        return self.queue[self.index(uid)]
+        if isinstance(uid, PlaylistItem):
+            uid = uid.uid
+        ret = self._items.get(uid)
+        if ret is None:
+            raise ValueError('no playlist item with uid %s' % uid)
+        return ret
 
     def remove(self, item):
         """Remove playlist item.
@@ -135,6 +141,9 @@ class Playlist:
             self.current_time = 0
             self.paused = True
         self.queue.remove(item)
+        if isinstance(item, PlaylistItem):
+            item = item.uid
+        del self._items[item]
 
     def add(self, after, item):
         """Add playlist item.
@@ -145,13 +154,21 @@ class Playlist:
             `int` - insert after item with ID, `None` - append.
         item : `dict` or `cytube_bot.playlist.PlaylistItem`
             Playlist item or data.
+            An existing item with the same ID is replaced.
         """
         if not isinstance(item, PlaylistItem):
             item = PlaylistItem(item)
         if not isinstance(after, int):
-            self.queue.append(item)
+            index = len(self.queue)
         else:
-            self.queue.insert(self.index(after) + 1, item)
+            index = self.index(after) + 1
+        if item.uid in self._items:
+            old = self.index(item.uid)
+            del self.queue[old]
+            if old < index:
+                index -= 1
+        self.queue.insert(index, item)
+        self._items[item.uid] = item
 
     def move(self, item, after):
         """Move playlist item.
@@ -172,4 +189,5 @@ class Playlist:
         self.paused = True
         self.current = None
         self.current_time = 0
+        self._items.clear()
         self.queue.clear()
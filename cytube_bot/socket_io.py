@@ -1,4 +1,5 @@
 import re
+import sys
 import json
 import socket
 import asyncio
@@ -71,7 +72,7 @@ class SocketIOResponse:
         return match
 
 
-class SocketIO:
+class SocketIO: # pylint:disable=too-many-instance-attributes
     """Asynchronous socket.io connection.
 
     Attributes
@@ -85,10 +86,13 @@ class SocketIO:
     error : `None` or `Exception`
     events : `asyncio.Queue` of ((`str`, `object`) or `None`)
         Event queue.
+    send_queue : `asyncio.Queue` of `str`
+        Outgoing message queue.
     response : `list` of `cytube_bot.socket_io.SocketIOResponse`
     response_lock : `asyncio.Lock`
     ping_task : `asyncio.tasks.Task`
     recv_task : `asyncio.tasks.Task`
+    send_task : `asyncio.tasks.Task`
     close_task : `asyncio.tasks.Task`
     closing : `asyncio.Event`
     closed : `asyncio.Event`
@@ -99,6 +103,8 @@ class SocketIO:
 
     logger = logging.getLogger(__name__)
 
+    SEND_QUEUE_SIZE = 64
+
     def __init__(self, websocket, config, qsize, loop):
         """
         Parameters
@@ -119,12 +125,14 @@ class SocketIO:
         self.closed = asyncio.Event(loop=self.loop)
         self.ping_response = asyncio.Event(loop=self.loop)
         self.events = Queue(maxsize=qsize, loop=self.loop)
+        self.send_queue = Queue(maxsize=self.SEND_QUEUE_SIZE, loop=self.loop)
         self.response = []
         self.response_lock = asyncio.Lock()
         self.ping_interval = max(1, config.get('pingInterval', 10000) / 1000)
         self.ping_timeout = max(1, config.get('pingTimeout', 10000) / 1000)
         self.ping_task = self.loop.create_task(self._ping())
         self.recv_task = self.loop.create_task(self._recv())
+        self.send_task = self.loop.create_task(self._send())
         self.close_task = None
 
     @property
@@ -189,15 +197,28 @@ class SocketIO:
             self.ping_task.cancel()
             self.logger.info('cancel recv task')
             self.recv_task.cancel()
+            self.logger.info('cancel send task')
+            self.send_task.cancel()
 
             self.logger.info('wait for tasks')
             yield from asyncio.wait_for(
-                asyncio.gather(self.ping_task, self.recv_task),
+                asyncio.gather(
+                    self.ping_task, self.recv_task, self.send_task,
+                    return_exceptions=True
+                ),
                 None, loop=self.loop
             )
 
             self.ping_response.clear()
 
+            self.logger.info('clear send queue')
+            dropped = self.send_queue.qsize()
+            while not self.send_queue.empty():
+                self.send_queue.get_nowait()
+                self.send_queue.task_done()
+            if dropped:
+                self.logger.warning('dropped %d queued messages', dropped)
+
             self.logger.info('close websocket')
             yield from self.websocket.close()
 
@@ -211,6 +232,7 @@ class SocketIO:
         finally:
             self.ping_task = None
             self.recv_task = None
+            self.send_task = None
             self.websocket = None
             self.closed.set()
 
@@ -236,9 +258,13 @@ class SocketIO:
         return ev
 
     @asyncio.coroutine
-    def emit(self, event, data, match_response=False, response_timeout=None):
+    def emit(self, event, data, match_response=None, response_timeout=None):
         """Send an event.
 
+        The message is written by the send task. Returns as soon as it is
+        queued if `match_response` is `None`; write errors close the
+        connection and are raised by the next call.
+
         Parameters
         ----------
         event : `str`
@@ -253,7 +279,7 @@ class SocketIO:
         Returns
         -------
         `object`
-            Response data if `get_response` is `True`.
+            Response data if `match_response` is not `None`.
 
         Raises
         ------
@@ -274,7 +300,9 @@ class SocketIO:
                 self.logger.info('get response %s', response)
                 self.response.append(response)
 
-            yield from self.websocket.send(data)
+            if self.closing.is_set():
+                raise self.error # pylint:disable=raising-bad-type
+            yield from self.send_queue.put(data)
 
             if match_response is not None:
                 self.response_lock.release()
@@ -352,6 +380,29 @@ class SocketIO:
             self.logger.error('ping error: %r', ex)
             self.error = ConnectionClosed(ex)
 
+    @asyncio.coroutine
+    def _send(self):
+        """Write task."""
+        try:
+            while self.error is None:
+                data = yield from self.send_queue.get()
+                self.send_queue.task_done()
+                yield from self.websocket.send(data)
+        except asyncio.CancelledError:
+            self.logger.info('send cancelled')
+        except (socket.error,
+                ProxyError,
+                websockets.exceptions.ConnectionClosed,
+                websockets.exceptions.InvalidState,
+                websockets.exceptions.PayloadTooBig,
+                websockets.exceptions.WebSocketProtocolError
+               ) as ex:
+            self.logger.error('send error: %r', ex)
+            self.error = ConnectionClosed(ex)
+        except Exception as ex:
+            self.error = ConnectionClosed(ex)
+            raise
+
     @asyncio.coroutine
     def _recv(self):
         """Read task."""
@@ -387,6 +438,9 @@ class SocketIO:
                             else:
                                 event = data[0]
                                 data = data[1:]
+                        if not isinstance(event, str):
+                            raise ValueError('invalid event name')
+                        event = sys.intern(event)
                     except ValueError as ex:
                         self.logger.error('invalid event %s: %r', data, ex)
                     else:
@@ -26,6 +26,11 @@ class User:
         `True` if user is shadow muted.
     """
 
+    __slots__ = (
+        'name', 'password', 'rank', 'image', 'text',
+        'afk', 'muted', 'smuted', '_ip', 'uncloaked_ip', 'aliases'
+    )
+
     def __init__(self,
                  name='', password=None,
                  rank=-1, profile=None, meta=None):
@@ -58,6 +63,9 @@ class User:
             return self.name == user
         return False
 
+    def __hash__(self):
+        return hash(self.name)
+
     @property
     def ip(self):
         """Cloaked IP.
@@ -66,6 +74,8 @@ class User:
 
     @ip.setter
     def ip(self, ip):
+        if ip == self._ip:
+            return
         self._ip = ip
         if ip is None:
             self.uncloaked_ip = None
@@ -82,9 +92,12 @@ class User:
     @profile.setter
     def profile(self, profile):
         if profile is None:
-            profile = {}
-        self.image = profile.get('image', '')
-        self.text = profile.get('text', '')
+            self.image = ''
+            self.text = ''
+            return
+        get = profile.get
+        self.image = get('image', '')
+        self.text = get('text', '')
 
     @property
     def meta(self):
@@ -99,12 +112,18 @@ class User:
     @meta.setter
     def meta(self, meta):
         if meta is None:
-            meta = {}
-        self.afk = meta.get('afk', False)
-        self.muted = meta.get('muted', False)
-        self.smuted = meta.get('smuted', False)
-        self.ip = meta.get('ip', None)
-        self.aliases = meta.get('aliases', [])
+            self.afk = False
+            self.muted = False
+            self.smuted = False
+            self.ip = None
+            self.aliases = []
+            return
+        get = meta.get
+        self.afk = get('afk', False)
+        self.muted = get('muted', False)
+        self.smuted = get('smuted', False)
+        self.ip = get('ip', None)
+        self.aliases = get('aliases', [])
 
     def update(self,
                name=None, rank=None,
@@ -169,6 +188,16 @@ class UserList(dict):
             raise ValueError('user exists: %s' % user.name)
         self[user.name] = user
 
+    def replace(self, users):
+        """Replace all users.
+
+        Parameters
+        ----------
+        users : iterable of `cytube_bot.user.User`
+        """
+        self.clear()
+        self.update((user.name, user) for user in users)
+
     def get(self, name):
         """Get user by name.
 
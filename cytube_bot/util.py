@@ -4,6 +4,7 @@ from html.parser import HTMLParser, unescape
 from hashlib import md5
 from base64 import b64encode
 from itertools import islice
+from functools import lru_cache
 from collections import Sequence
 
 import requests
@@ -150,19 +151,23 @@ def to_sequence(obj):
     return obj
 
 
-def get(url, loop):
+def get(url, loop, session=None):
     """Asynchronous HTTP GET request.
 
     Parameters
     ----------
     url: `str`
     loop: `asyncio.events.AbstractEventLoop`
+    session: `None` or `requests.Session`, optional
+        HTTP session (`None` - no session).
+        A session must not be used by several requests at once.
 
     Returns
     -------
     `asyncio.futures.Future`
     """
-    return loop.run_in_executor(None, lambda: requests.get(url).text)
+    get_ = requests.get if session is None else session.get
+    return loop.run_in_executor(None, lambda: get_(url).text)
 
 
 def ip_hash(string, length):
@@ -217,9 +222,26 @@ def _uncloak_ip(cloaked_parts, uncloaked_parts, acc, i, ret):
                 ret
             )
 
+@lru_cache(maxsize=4096)
+def _uncloak_ip_cached(ip, start):
+    parts = ip.split('.')
+    if start is None:
+        for start, part in enumerate(parts):
+            try:
+                val = int(part)
+                if val < 0 or val > 255:
+                    break
+            except ValueError:
+                break
+    ret = []
+    _uncloak_ip(parts, list(parts), '', start, ret)
+    return tuple(ret)
+
 def uncloak_ip(ip, start=0):
     """Uncloak IP.
 
+    Results are cached.
+
     Parameters
     ----------
     ip : `str`
@@ -242,15 +264,4 @@ def uncloak_ip(ip, start=0):
     >>> uncloak_ip('127.0.ou9.RBl', None)
     ['127.0.0.1']
     """
-    parts = ip.split('.')
-    if start is None:
-        for start, part in enumerate(parts):
-            try:
-                val = int(part)
-                if val < 0 or val > 255:
-                    break
-            except ValueError:
-                break
-    ret = []
-    _uncloak_ip(parts, list(parts), '', start, ret)
-    return ret
+    return list(_uncloak_ip_cached(ip, start))
@@ -0,0 +1,160 @@
+import asyncio
+import pytest
+
+from cytube_bot.bot import Bot
+from cytube_bot.error import Kicked
+
+
+@pytest.mark.asyncio
+async def test_trigger_coroutine_builtin(event_loop):
+    class CoroutineBot(Bot):
+        async def _on_rank(self, _, data):
+            self.user.rank = data
+
+    bot = CoroutineBot('domain', 'channel', loop=event_loop)
+    seen = []
+    bot.on('rank', lambda ev, data: seen.append(data))
+    await bot.trigger('rank', 2)
+    assert bot.user.rank == 2
+    assert seen == [2]
+
+
+class Socket:
+    def __init__(self, events):
+        self.events = asyncio.Queue()
+        for event in events:
+            self.events.put_nowait(event)
+        self.closed = False
+
+    async def recv(self):
+        return await self.events.get()
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_run_connected(event_loop):
+    bot = Bot('domain', 'channel', loop=event_loop)
+    bot.socket = Socket([('setMotd', 'motd')])
+    task = event_loop.create_task(bot.run())
+    await asyncio.sleep(0.01)
+    task.cancel()
+    await task
+    assert bot.channel.motd == 'motd'
+
+
+@pytest.mark.asyncio
+async def test_run_socket_replaced(event_loop):
+    bot = Bot('domain', 'channel', loop=event_loop)
+    old = Socket([('reconnect', None)])
+    new = Socket([('setMotd', 'motd')])
+
+    def reconnect(*_):
+        bot.socket = new
+
+    bot.on('reconnect', reconnect)
+    bot.socket = old
+    task = event_loop.create_task(bot.run())
+    await asyncio.sleep(0.01)
+    task.cancel()
+    await task
+    assert bot.channel.motd == 'motd'
+    assert not old.closed
+    assert new.closed
+
+
+@pytest.mark.asyncio
+async def test_http_session(event_loop, mocker):
+    session_class = mocker.patch('requests.Session')
+    session = session_class.return_value
+    session.get.return_value.text = (
+        '{"servers": [{"url": "http://srv"},'
+        ' {"url": "https://srv", "secure": true}]}'
+    )
+
+    async def socket_io(url, loop):
+        return Socket([])
+
+    bot = Bot('domain', 'channel', loop=event_loop, socket_io=socket_io)
+    await bot.connect()
+    bot.server = None
+    await bot.connect()
+    assert bot.server == 'https://srv/socket.io/'
+    assert session_class.call_count == 1
+    assert session.get.call_count == 2
+    assert not session.close.called
+    task = event_loop.create_task(bot.run())
+    await asyncio.sleep(0.01)
+    task.cancel()
+    await task
+    assert session.close.called
+    assert bot._http_session is None
+
+
+def media_update(time):
+    return 'mediaUpdate', {'currentTime': time, 'paused': False}
+
+
+def record(bot, *events):
+    seen = []
+    for event in events:
+        bot.on(event, lambda ev, data: seen.append((ev, data)))
+    return seen
+
+
+@pytest.mark.asyncio
+async def test_trigger_no_coalesce(event_loop):
+    bot = Bot('domain', 'channel', loop=event_loop)
+    seen = record(bot, 'mediaUpdate')
+    for time in range(3):
+        await bot.trigger(*media_update(time))
+    assert seen == [media_update(time) for time in range(3)]
+
+
+@pytest.mark.asyncio
+async def test_trigger_coalesce_order(event_loop):
+    bot = Bot('domain', 'channel', loop=event_loop)
+    bot.EVENT_COALESCE = {'mediaUpdate': 10}
+    seen = record(bot, 'mediaUpdate', 'chatMsg')
+    for time in range(3):
+        await bot.trigger(*media_update(time))
+        assert bot.channel.playlist.current_time == time
+    assert seen == [media_update(0)]
+    await bot.trigger('chatMsg', 'msg')
+    assert seen == [media_update(0), media_update(2), ('chatMsg', 'msg')]
+    await bot.trigger(*media_update(3))
+    assert seen[-1] == ('chatMsg', 'msg')
+    await bot.disconnect()
+    await bot.trigger('chatMsg', 'msg2')
+    assert seen[-2:] == [('chatMsg', 'msg'), ('chatMsg', 'msg2')]
+
+
+@pytest.mark.asyncio
+async def test_run_coalesce_flush(event_loop):
+    bot = Bot('domain', 'channel', loop=event_loop)
+    bot.EVENT_COALESCE = {'mediaUpdate': 0.05}
+    seen = record(bot, 'mediaUpdate')
+    bot.socket = Socket([media_update(time) for time in range(3)])
+    task = event_loop.create_task(bot.run())
+    await asyncio.sleep(0.01)
+    assert seen == [media_update(0)]
+    await asyncio.sleep(0.1)
+    assert seen == [media_update(0), media_update(2)]
+    task.cancel()
+    await task
+
+
+@pytest.mark.asyncio
+async def test_run_coalesce_error(event_loop):
+    def kick(_, data):
+        if data['currentTime'] > 0:
+            raise Kicked()
+
+    bot = Bot('domain', 'channel', loop=event_loop)
+    bot.EVENT_COALESCE = {'mediaUpdate': 0.05}
+    bot.socket = Socket([media_update(0), media_update(1)])
+    bot.on('mediaUpdate', kick)
+    task = event_loop.create_task(bot.run())
+    with pytest.raises(Kicked):
+        await asyncio.wait_for(task, 1)
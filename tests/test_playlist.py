@@ -0,0 +1,95 @@
+import pytest
+
+from cytube_bot.playlist import Playlist, PlaylistItem
+
+
+def item(uid):
+    return {
+        'uid': uid,
+        'temp': True,
+        'queueby': 'user',
+        'media': {
+            'type': 'yt',
+            'id': 'id%d' % uid,
+            'title': 'title %d' % uid,
+            'seconds': 60
+        }
+    }
+
+
+def check(playlist, uids):
+    assert [x.uid for x in playlist.queue] == uids
+    assert sorted(playlist._items) == sorted(uids)
+    for uid in uids:
+        assert playlist.get(uid).uid == uid
+
+
+@pytest.fixture
+def playlist():
+    ret = Playlist()
+    for uid in range(4):
+        ret.add(None, item(uid))
+    return ret
+
+
+def test_add(playlist):
+    check(playlist, [0, 1, 2, 3])
+    playlist.add(1, item(4))
+    check(playlist, [0, 1, 4, 2, 3])
+    playlist.add(None, PlaylistItem(item(5)))
+    check(playlist, [0, 1, 4, 2, 3, 5])
+
+
+def test_add_duplicate(playlist):
+    playlist.add(None, item(1))
+    check(playlist, [0, 2, 3, 1])
+    playlist.remove(1)
+    check(playlist, [0, 2, 3])
+    with pytest.raises(ValueError):
+        playlist.get(1)
+
+
+def test_add_duplicate_after(playlist):
+    with pytest.raises(ValueError):
+        playlist.add(99, item(1))
+    check(playlist, [0, 1, 2, 3])
+    playlist.add(1, item(1))
+    check(playlist, [0, 1, 2, 3])
+    playlist.add(3, item(1))
+    check(playlist, [0, 2, 3, 1])
+    playlist.add(0, item(1))
+    check(playlist, [0, 1, 2, 3])
+
+
+def test_get(playlist):
+    res = playlist.get(2)
+    assert isinstance(res, PlaylistItem)
+    assert playlist.get(res) is res
+    with pytest.raises(ValueError):
+        playlist.get(10)
+
+
+def test_remove(playlist):
+    playlist.current = 1
+    playlist.remove(1)
+    assert playlist.current is None
+    check(playlist, [0, 2, 3])
+    playlist.remove(playlist.get(3))
+    check(playlist, [0, 2])
+    with pytest.raises(ValueError):
+        playlist.remove(3)
+    check(playlist, [0, 2])
+
+
+def test_move(playlist):
+    playlist.move(0, 2)
+    check(playlist, [1, 2, 0, 3])
+    playlist.move(playlist.get(3), 1)
+    check(playlist, [1, 3, 2, 0])
+
+
+def test_clear(playlist):
+    playlist.clear()
+    check(playlist, [])
+    playlist.add(None, item(0))
+    check(playlist, [0])
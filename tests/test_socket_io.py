@@ -0,0 +1,76 @@
+import asyncio
+import pytest
+
+from cytube_bot.socket_io import SocketIO
+from cytube_bot.error import SocketIOError
+
+
+class Websocket:
+    def __init__(self, loop, error=None):
+        self.sent = []
+        self.error = error
+        self.closed = asyncio.Event(loop=loop)
+
+    async def send(self, data):
+        if self.error is not None:
+            raise self.error
+        self.sent.append(data)
+
+    async def recv(self):
+        await self.closed.wait()
+        raise ConnectionError()
+
+    async def close(self):
+        self.closed.set()
+
+
+@pytest.mark.asyncio
+async def test_emit(event_loop):
+    websocket = Websocket(event_loop)
+    io = SocketIO(websocket, {}, 0, event_loop)
+    try:
+        await io.emit('event', 0)
+        await io.emit('event', 1)
+        await asyncio.sleep(0.01)
+        assert websocket.sent == ['42["event", 0]', '42["event", 1]']
+    finally:
+        await io.close()
+
+
+@pytest.mark.asyncio
+async def test_emit_error(event_loop):
+    websocket = Websocket(event_loop, ConnectionError())
+    io = SocketIO(websocket, {}, 0, event_loop)
+    try:
+        await io.emit('event', 0)
+        await asyncio.sleep(0.01)
+        with pytest.raises(SocketIOError):
+            await io.emit('event', 1)
+    finally:
+        await io.close()
+
+
+@pytest.mark.asyncio
+async def test_emit_no_wait(event_loop):
+    websocket = Websocket(event_loop)
+    io = SocketIO(websocket, {}, 0, event_loop)
+    try:
+        await io.emit('event', 0)
+        assert websocket.sent == []
+        await asyncio.sleep(0.01)
+        assert websocket.sent == ['42["event", 0]']
+    finally:
+        await io.close()
+    with pytest.raises(SocketIOError):
+        await io.emit('event', 1)
+
+
+@pytest.mark.asyncio
+async def test_ping(event_loop):
+    websocket = Websocket(event_loop)
+    io = SocketIO(websocket, {'pingInterval': 1000}, 0, event_loop)
+    try:
+        await asyncio.sleep(1.1)
+        assert websocket.sent == ['2']
+    finally:
+        await io.close()
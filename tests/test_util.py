@@ -47,3 +47,9 @@ def test_cloak_ip(test, res):
 ])
 def test_uncloak_ip(test, res):
     assert uncloak_ip(*test) == res
+
+
+def test_uncloak_ip_cached():
+    res = uncloak_ip('yFA.j8g.iXh.gvS')
+    res.append('0.0.0.0')
+    assert uncloak_ip('yFA.j8g.iXh.gvS') == ['127.0.0.1']